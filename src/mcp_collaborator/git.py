@@ -1,4 +1,11 @@
+import atexit
 import logging
+import os
+import subprocess
+import sys
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Sequence
 from mcp.server import Server
@@ -13,53 +20,72 @@ from mcp.types import (
 )
 from enum import Enum
 import git
-from pydantic import BaseModel
+from dataclasses import dataclass
 
-class GitStatus(BaseModel):
+logger = logging.getLogger("mcp-collaborator")
+
+@dataclass
+class GitStatus:
+    checkout_path: str
+
+@dataclass
+class GitStatusSummary:
     checkout_path: str
 
-class GitDiffUnstaged(BaseModel):
+@dataclass
+class GitDiffUnstaged:
     checkout_path: str
 
-class GitDiffStaged(BaseModel):
+@dataclass
+class GitDiffStaged:
     checkout_path: str
 
-class GitDiff(BaseModel):
+@dataclass
+class GitDiff:
     checkout_path: str
     target: str
 
-class GitCommit(BaseModel):
+@dataclass
+class GitCommit:
     checkout_path: str
     message: str
 
-class GitAdd(BaseModel):
+@dataclass
+class GitAdd:
     checkout_path: str
     files: list[str]
 
-class GitReset(BaseModel):
+@dataclass
+class GitReset:
     checkout_path: str
 
-class GitLog(BaseModel):
+@dataclass
+class GitLog:
     checkout_path: str
     max_count: int = 10
 
-class GitCreateBranch(BaseModel):
+@dataclass
+class GitCreateBranch:
     checkout_path: str
     branch_name: str
     base_branch: str | None = None
 
-class GitCheckout(BaseModel):
+@dataclass
+class GitCheckout:
     checkout_path: str
 
-class GitShow(BaseModel):
+@dataclass
+class GitShow:
     checkout_path: str
     revision: str
 
-class GitInit(BaseModel):
+@dataclass
+class GitInit:
     checkout_path: str
 
 class GitTools(str, Enum):
     STATUS = "git_status"
+    STATUS_SUMMARY = "git_status_summary"
     DIFF_UNSTAGED = "git_diff_unstaged"
     DIFF_STAGED = "git_diff_staged"
     DIFF = "git_diff"
@@ -72,17 +98,68 @@ class GitTools(str, Enum):
     SHOW = "git_show"
     # INIT = "git_init" # Presumed to be done before this tool is called.
 
+def _git(repo: git.Repo, *args: str) -> str:
+    """Run a git command directly, bypassing GitPython's command wrapper."""
+    command = ["git", "-C", repo.working_tree_dir or repo.git_dir, *args]
+    result = subprocess.run(
+        command,
+        # Never let git (or hooks/diff drivers it runs) read the MCP stdin stream.
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        # Keep output stable regardless of the user's locale, as GitPython does.
+        env={**os.environ, "LANGUAGE": "C", "LC_ALL": "C"},
+    )
+    if result.returncode != 0:
+        raise git.GitCommandError(command, result.returncode, result.stderr, result.stdout)
+    output = result.stdout.decode("utf-8", "replace")
+    return output[:-1] if output.endswith("\n") else output
+
+def git_enable_status_cache(repo: git.Repo) -> None:
+    """Turn on git's untracked cache (and fsmonitor where supported) for faster status."""
+    try:
+        # Stored in the checkout's own index; with core.untrackedCache unset git
+        # keeps it, so a worktree doesn't need to touch the shared repo config.
+        _git(repo, "update-index", "--untracked-cache")
+        # The builtin fsmonitor daemon only exists on macOS and Windows. A worktree
+        # shares its config with the source repository, so only set it there when
+        # per-worktree config is available.
+        if sys.platform in ("darwin", "win32"):
+            if Path(repo.git_dir) == Path(repo.common_dir):
+                _git(repo, "config", "core.fsmonitor", "true")
+            elif _git(repo, "config", "--type=bool", "--default=false", "extensions.worktreeConfig") == "true":
+                _git(repo, "config", "--worktree", "core.fsmonitor", "true")
+    except git.GitCommandError as e:
+        logger.warning(f"Could not enable status caches: {e}")
+
+def _commit_header(hexsha: str, author: str, date: datetime | None) -> str:
+    # Both git_log and git_show read every field in a single git call up front;
+    # the message follows directly after this header.
+    return (
+        f"Commit: {hexsha}\n"
+        f"Author: {author}\n"
+        f"Date: {date}\n"
+        f"Message: "
+    )
+
 def git_status(repo: git.Repo) -> str:
-    return repo.git.status()
+    return _git(repo, "status")
+
+def git_status_summary(repo: git.Repo) -> str:
+    # Compares HEAD, the index and tracked files only. Skipping the untracked
+    # file scan is what makes this much cheaper than `git status` on big trees.
+    staged = _git(repo, "diff", "--cached", "--name-only").splitlines()
+    unstaged = _git(repo, "diff", "--name-only").splitlines()
+    return f"Staged files: {len(staged)}\nUnstaged files: {len(unstaged)}"
 
 def git_diff_unstaged(repo: git.Repo) -> str:
-    return repo.git.diff()
+    return _git(repo, "diff")
 
 def git_diff_staged(repo: git.Repo) -> str:
-    return repo.git.diff("--cached")
+    return _git(repo, "diff", "--cached")
 
 def git_diff(repo: git.Repo, target: str) -> str:
-    return repo.git.diff(target)
+    return _git(repo, "diff", target)
 
 def git_commit(repo: git.Repo, message: str) -> str:
     commit = repo.index.commit(message)
@@ -97,14 +174,22 @@ def git_reset(repo: git.Repo) -> str:
     return "All staged changes reset"
 
 def git_log(repo: git.Repo, max_count: int = 10) -> list[str]:
-    commits = list(repo.iter_commits(max_count=max_count))
+    # One `git log` call for all commits; fields are split on US, records on RS.
+    raw = _git(
+        repo,
+        "log",
+        f"--max-count={max_count}",
+        "--format=%H%x1f%an%x1f%aI%x1f%B%x1e",
+    )
     log = []
-    for commit in commits:
+    for record in raw.split("\x1e"):
+        record = record.lstrip("\n")
+        if not record:
+            continue
+        hexsha, author, date, message = record.split("\x1f", 3)
         log.append(
-            f"Commit: {commit.hexsha}\n"
-            f"Author: {commit.author}\n"
-            f"Date: {commit.authored_datetime}\n"
-            f"Message: {commit.message}\n"
+            _commit_header(hexsha, author, datetime.fromisoformat(date))
+            + f"{message}\n"
         )
     return log
 
@@ -121,6 +206,10 @@ def git_checkout(repo: git.Repo, branch_name: str) -> str:
     repo.git.checkout(b=branch_name)
     return f"Initialized new working checkout path: '{branch_name}'"
 
+def git_worktree_add(repo: git.Repo, path: Path, branch_name: str) -> str:
+    repo.git.worktree("add", "-b", branch_name, str(path))
+    return f"Initialized new working checkout path: '{branch_name}'"
+
 # def git_init(repo_path: str) -> str:
 #     try:
 #         repo = git.Repo.init(path=repo_path, mkdir=True)
@@ -128,20 +217,120 @@ def git_checkout(repo: git.Repo, branch_name: str) -> str:
 #     except Exception as e:
 #         return f"Error initializing repository: {str(e)}"
 
+# Long-running git processes (`cat-file --batch`, `diff-tree --stdin`), keyed by
+# git dir and command. Kept per thread so concurrent tool calls never interleave
+# requests on the same pipe. Each thread keeps only the most recently used ones,
+# so repositories that are no longer queried (or were deleted) don't pin a
+# process until exit.
+_local = threading.local()
+_MAX_PROCS_PER_THREAD = 8
+# Every process started above, across all threads, so they can be shut down.
+_all_procs: set[subprocess.Popen] = set()
+_all_procs_lock = threading.Lock()
+
+# diff-tree echoes stdin lines that aren't object names, so this marks the end of
+# each diff. No patch line can start with "#".
+_DIFF_TREE_END = b"# mcp-collaborator: end of diff\n"
+
+def _git_process(repo: git.Repo, *args: str) -> subprocess.Popen:
+    procs = getattr(_local, "procs", None)
+    if procs is None:
+        procs = _local.procs = OrderedDict()
+    key = (repo.git_dir, args)
+    proc = procs.get(key)
+    if proc is not None and proc.poll() is None:
+        procs.move_to_end(key)
+        return proc
+    if proc is not None:
+        del procs[key]
+        _close_process(proc)
+    while len(procs) >= _MAX_PROCS_PER_THREAD:
+        _close_process(procs.popitem(last=False)[1])
+    proc = subprocess.Popen(
+        ["git", "-C", repo.git_dir, *args],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+    )
+    procs[key] = proc
+    with _all_procs_lock:
+        _all_procs.add(proc)
+    return proc
+
+def _close_process(proc: subprocess.Popen) -> None:
+    with _all_procs_lock:
+        _all_procs.discard(proc)
+    # Closing stdin makes cat-file and diff-tree exit on their own. Flushing
+    # it fails if the process is already gone.
+    try:
+        proc.stdin.close()
+    except OSError:
+        pass
+    try:
+        proc.wait(timeout=1)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+@atexit.register
+def _close_git_processes() -> None:
+    with _all_procs_lock:
+        procs = list(_all_procs)
+    for proc in procs:
+        _close_process(proc)
+
+def _read_commit(repo: git.Repo, revision: str) -> tuple[str, bytes]:
+    if "\n" in revision:
+        raise ValueError(f"Invalid revision: {revision!r}")
+    proc = _git_process(repo, "cat-file", "--batch")
+    proc.stdin.write(f"{revision}^{{commit}}\n".encode())
+    proc.stdin.flush()
+    header = proc.stdout.readline().decode()
+    if not header:
+        raise RuntimeError("git cat-file exited unexpectedly")
+    parts = header.rsplit(" ", 2)
+    if len(parts) != 3 or parts[1] != "commit" or not parts[2].strip().isdigit():
+        raise ValueError(f"Unknown revision: {revision}")
+    # The object body is followed by a single LF.
+    body = proc.stdout.read(int(parts[2]) + 1)[:-1]
+    return parts[0], body
+
+def _diff_tree(repo: git.Repo, hexsha: str, parent: str | None) -> bytes:
+    proc = _git_process(
+        repo, "diff-tree", "--stdin", "--no-commit-id", "-p", "-r", "--root"
+    )
+    # "<commit> <parent>" diffs against that parent; a lone root commit is
+    # diffed against the empty tree because of --root.
+    request = f"{hexsha} {parent}\n" if parent else f"{hexsha}\n"
+    proc.stdin.write(request.encode() + _DIFF_TREE_END)
+    proc.stdin.flush()
+    output = bytearray()
+    for line in iter(proc.stdout.readline, b""):
+        if line == _DIFF_TREE_END:
+            return bytes(output)
+        output += line
+    raise RuntimeError("git diff-tree exited unexpectedly")
+
+def _parse_author(value: str) -> tuple[str, datetime]:
+    ident, timestamp, offset = value.rsplit(" ", 2)
+    name = ident[: ident.rfind(" <")]
+    minutes = int(offset[1:3]) * 60 + int(offset[3:5])
+    tz = timezone(timedelta(minutes=-minutes if offset[0] == "-" else minutes))
+    return name, datetime.fromtimestamp(int(timestamp), tz)
+
 def git_show(repo: git.Repo, revision: str) -> str:
-    commit = repo.commit(revision)
-    output = [
-        f"Commit: {commit.hexsha}\n"
-        f"Author: {commit.author}\n"
-        f"Date: {commit.authored_datetime}\n"
-        f"Message: {commit.message}\n"
-    ]
-    if commit.parents:
-        parent = commit.parents[0]
-        diff = parent.diff(commit, create_patch=True)
-    else:
-        diff = commit.diff(git.NULL_TREE, create_patch=True)
-    for d in diff:
-        output.append(f"\n--- {d.a_path}\n+++ {d.b_path}\n")
-        output.append(d.diff.decode('utf-8'))
-    return "".join(output)
+    hexsha, body = _read_commit(repo, revision)
+    headers, _, message = body.partition(b"\n\n")
+    parents = []
+    author, date = "", None
+    for line in headers.split(b"\n"):
+        key, _, value = line.partition(b" ")
+        if key == b"parent":
+            parents.append(value.decode())
+        elif key == b"author":
+            author, date = _parse_author(value.decode("utf-8", "replace"))
+    # Accumulate raw bytes and decode once at the end rather than per hunk.
+    output = bytearray(_commit_header(hexsha, author, date).encode())
+    output += message
+    output += b"\n\n"
+    output += _diff_tree(repo, hexsha, parents[0] if parents else None)
+    return output.decode("utf-8", "replace")
@@ -1,8 +1,14 @@
 """MCP Text Editor Server implementation, with git integrations."""
 
+import asyncio
+import io
 import logging
+import os
+import sys
 import traceback
-from collections.abc import Sequence
+from collections.abc import Awaitable, Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any, List
 
 from git import Repo
@@ -16,23 +22,29 @@ from mcp_collaborator.git import (
     GitReset,
     GitShow,
     GitStatus,
+    GitStatusSummary,
     GitTools,
     git_checkout,
     git_commit,
     git_diff,
     git_diff_staged,
     git_diff_unstaged,
+    git_enable_status_cache,
     git_log,
     git_reset,
     git_show,
     git_status,
+    git_status_summary,
+    git_worktree_add,
 )
 
+import anyio
 import click
 from pathlib import Path
 
 from mcp.server import Server
 from mcp.types import TextContent, Tool
+from pydantic import TypeAdapter
 
 from .handlers import (
     AppendTextFileContentsHandler,
@@ -49,6 +61,161 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("mcp-collaborator")
 
 
+@lru_cache(maxsize=128)
+def _resolve_checkout(checkouts_str: str, checkout_path: str) -> str:
+    """Resolve a checkout path under the checkouts root, rejecting paths outside it."""
+    root = Path(checkouts_str).resolve()
+    checkout = (root / checkout_path).resolve()
+    if checkout == root or not checkout.is_relative_to(root):
+        raise ValueError(f"Checkout path must stay inside the checkouts root: {checkout_path}")
+    return str(checkout)
+
+
+@lru_cache(maxsize=128)
+def _get_repo(path_str: str) -> Repo:
+    """Return a shared Repo for a resolved checkout path, opening it on first use."""
+    # The checkout directory must itself be the repository; never fall back to a
+    # parent repository (e.g. when the checkouts root lives inside one).
+    repo = Repo(path_str, search_parent_directories=False)
+    git_enable_status_cache(repo)
+    return repo
+
+
+def _create_checkout(repository: str | Path, checkout: Path, branch_name: str) -> str:
+    """Create a checkout of repository at checkout on a new branch."""
+    if Path(repository).is_dir():
+        # Local repositories get a worktree sharing their object database
+        # rather than a full copy.
+        return git_worktree_add(Repo(repository), checkout, branch_name)
+    # A blobless partial clone keeps full history (log/show/diff still
+    # work) but only fetches file contents as they are needed.
+    repo = Repo.clone_from(repository, checkout, multi_options=["--filter=blob:none"])
+    return git_checkout(repo, branch_name)
+
+
+def _chunk_text(text: str, size: int = 65536) -> list[TextContent]:
+    """Split text into TextContent items of at most size characters, on line breaks where possible."""
+    chunks = []
+    start = 0
+    while len(text) - start > size:
+        end = text.rfind("\n", start, start + size) + 1
+        if end <= start:
+            end = start + size
+        chunks.append(TextContent(type="text", text=text[start:end]))
+        start = end
+    chunks.append(TextContent(type="text", text=text[start:]))
+    return chunks
+
+
+def _stdout_writer() -> anyio.AsyncFile[str] | None:
+    """Open stdout as a fully buffered UTF-8 stream for MCP message framing."""
+    # stdio_server writes each JSON-RPC message and then flushes it, so with a
+    # private buffer every message goes out in a single write regardless of how
+    # sys.stdout itself is configured (line buffering, PYTHONUNBUFFERED, locale).
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        return None
+    return anyio.wrap_file(os.fdopen(fd, "w", encoding="utf-8", closefd=False))
+
+
+# Tool input schemas never change at runtime, so build them once at import.
+_SCHEMAS = {
+    model.__name__: TypeAdapter(model).json_schema()
+    for model in (
+        GitStatus,
+        GitStatusSummary,
+        GitDiffUnstaged,
+        GitDiffStaged,
+        GitDiff,
+        GitCommit,
+        GitReset,
+        GitLog,
+        GitCheckout,
+        GitShow,
+    )
+}
+
+
+# Read-only git commands run in worker threads so concurrent requests don't block
+# the event loop. Commit and reset stay on the loop thread: they go through
+# GitPython's object database, whose persistent cat-file process is not safe to
+# share across threads.
+#
+# `git status` refreshes and writes back the index (which is also what keeps the
+# untracked cache up to date), so it holds index.lock while it runs. Commit and
+# reset write the index too and fail if that lock is taken, so all three are
+# serialized per repository.
+_index_locks: dict[str, asyncio.Lock] = {}
+
+
+def _index_lock(repo: Repo) -> asyncio.Lock:
+    return _index_locks.setdefault(repo.git_dir, asyncio.Lock())
+
+
+async def _git_status_tool(repo: Repo, arguments: Any) -> Sequence[TextContent]:
+    async with _index_lock(repo):
+        status = await asyncio.to_thread(git_status, repo)
+    return [TextContent(type="text", text=f"Repository status:\n{status}")]
+
+
+async def _git_status_summary_tool(repo: Repo, arguments: Any) -> Sequence[TextContent]:
+    summary = await asyncio.to_thread(git_status_summary, repo)
+    return [TextContent(type="text", text=summary)]
+
+
+async def _git_diff_unstaged_tool(repo: Repo, arguments: Any) -> Sequence[TextContent]:
+    diff = await asyncio.to_thread(git_diff_unstaged, repo)
+    return _chunk_text(f"Unstaged changes:\n{diff}")
+
+
+async def _git_diff_staged_tool(repo: Repo, arguments: Any) -> Sequence[TextContent]:
+    diff = await asyncio.to_thread(git_diff_staged, repo)
+    return _chunk_text(f"Staged changes:\n{diff}")
+
+
+async def _git_diff_tool(repo: Repo, arguments: Any) -> Sequence[TextContent]:
+    diff = await asyncio.to_thread(git_diff, repo, arguments["target"])
+    return _chunk_text(f"Diff with {arguments['target']}:\n{diff}")
+
+
+async def _git_commit_tool(repo: Repo, arguments: Any) -> Sequence[TextContent]:
+    async with _index_lock(repo):
+        result = git_commit(repo, arguments["message"])
+    return [TextContent(type="text", text=result)]
+
+
+async def _git_reset_tool(repo: Repo, arguments: Any) -> Sequence[TextContent]:
+    async with _index_lock(repo):
+        result = git_reset(repo)
+    return [TextContent(type="text", text=result)]
+
+
+async def _git_log_tool(repo: Repo, arguments: Any) -> Sequence[TextContent]:
+    log = await asyncio.to_thread(git_log, repo, arguments.get("max_count", 10))
+    return _chunk_text("Commit history:\n" + "\n".join(log))
+
+
+async def _git_show_tool(repo: Repo, arguments: Any) -> Sequence[TextContent]:
+    result = await asyncio.to_thread(git_show, repo, arguments["revision"])
+    return _chunk_text(result)
+
+
+# Git tools that operate on an existing checkout. CHECKOUT creates the checkout,
+# so it is handled separately in call_tool.
+_HANDLERS: dict[GitTools, Callable[[Repo, Any], Awaitable[Sequence[TextContent]]]] = {
+    GitTools.STATUS: _git_status_tool,
+    GitTools.STATUS_SUMMARY: _git_status_summary_tool,
+    GitTools.DIFF_UNSTAGED: _git_diff_unstaged_tool,
+    GitTools.DIFF_STAGED: _git_diff_staged_tool,
+    GitTools.DIFF: _git_diff_tool,
+    GitTools.COMMIT: _git_commit_tool,
+    GitTools.RESET: _git_reset_tool,
+    GitTools.LOG: _git_log_tool,
+    GitTools.SHOW: _git_show_tool,
+}
+
+
 @click.command()
 @click.option("--repository", "-r", type=Path, help="Git repository path")
 @click.option("--checkouts", "-c", type=Path, help="Checkout root path")
@@ -62,6 +229,17 @@ async def main(repository: Path, checkouts: Path) -> None:
     append_file_handler = AppendTextFileContentsHandler()
     delete_contents_handler = DeleteTextFileContentsHandler()
     insert_file_handler = InsertTextFileContentsHandler()
+    text_handlers = {
+        handler.name: handler
+        for handler in (
+            get_contents_handler,
+            create_file_handler,
+            append_file_handler,
+            delete_contents_handler,
+            insert_file_handler,
+            patch_file_handler,
+        )
+    }
 
 
     @app.list_tools()
@@ -71,47 +249,52 @@ async def main(repository: Path, checkouts: Path) -> None:
             Tool(
                 name=GitTools.STATUS,
                 description="Shows the working tree status",
-                inputSchema=GitStatus.schema(),
+                inputSchema=_SCHEMAS["GitStatus"],
+            ),
+            Tool(
+                name=GitTools.STATUS_SUMMARY,
+                description="Counts staged and unstaged files without scanning for untracked files",
+                inputSchema=_SCHEMAS["GitStatusSummary"],
             ),
             Tool(
                 name=GitTools.DIFF_UNSTAGED,
                 description="Shows changes in the working directory that are not yet staged",
-                inputSchema=GitDiffUnstaged.schema(),
+                inputSchema=_SCHEMAS["GitDiffUnstaged"],
             ),
             Tool(
                 name=GitTools.DIFF_STAGED,
                 description="Shows changes that are staged for commit",
-                inputSchema=GitDiffStaged.schema(),
+                inputSchema=_SCHEMAS["GitDiffStaged"],
             ),
             Tool(
                 name=GitTools.DIFF,
                 description="Shows differences between branches or commits",
-                inputSchema=GitDiff.schema(),
+                inputSchema=_SCHEMAS["GitDiff"],
             ),
             Tool(
                 name=GitTools.COMMIT,
                 description="Records changes to the repository",
-                inputSchema=GitCommit.schema(),
+                inputSchema=_SCHEMAS["GitCommit"],
             ),
             Tool(
                 name=GitTools.RESET,
                 description="Unstages all staged changes",
-                inputSchema=GitReset.schema(),
+                inputSchema=_SCHEMAS["GitReset"],
             ),
             Tool(
                 name=GitTools.LOG,
                 description="Shows the commit logs",
-                inputSchema=GitLog.schema(),
+                inputSchema=_SCHEMAS["GitLog"],
             ),
             Tool(
                 name=GitTools.CHECKOUT,
                 description="Checks out a new branch to begin work. The checkout path used here must be the same as the one used in all other tools.",
-                inputSchema=GitCheckout.schema(),
+                inputSchema=_SCHEMAS["GitCheckout"],
             ),
             Tool(
                 name=GitTools.SHOW,
                 description="Shows the contents of a commit",
-                inputSchema=GitShow.schema(),
+                inputSchema=_SCHEMAS["GitShow"],
             ),
             get_contents_handler.get_tool_description(),
             create_file_handler.get_tool_description(),
@@ -127,95 +310,30 @@ async def main(repository: Path, checkouts: Path) -> None:
         """Handle tool calls."""
         logger.info(f"Calling tool: {name}")
 
-        checkout = Path(checkouts, arguments["checkout_path"])
-        
-        if name == GitTools.CHECKOUT:
-            repo = Repo.clone_from(repository, checkout)
-            status = git_checkout(repo, arguments["checkout_path"])
+        try:
+            tool = GitTools(name)
+        except ValueError:
+            tool = None
+
+        if tool is GitTools.CHECKOUT:
+            checkout = Path(_resolve_checkout(str(checkouts), arguments["checkout_path"]))
+            status = _create_checkout(repository, checkout, arguments["checkout_path"])
             return [TextContent(
                 type="text",
                 text=status
             )]
 
         try:
-            match name:
-                case GitTools.STATUS:
-                    repo = Repo(checkout)
-                    status = git_status(repo)
-                    return [TextContent(
-                        type="text",
-                        text=f"Repository status:\n{status}"
-                    )]
-
-                case GitTools.DIFF_UNSTAGED:
-                    repo = Repo(checkout)
-                    diff = git_diff_unstaged(repo)
-                    return [TextContent(
-                        type="text",
-                        text=f"Unstaged changes:\n{diff}"
-                    )]
-
-                case GitTools.DIFF_STAGED:
-                    repo = Repo(checkout)
-                    diff = git_diff_staged(repo)
-                    return [TextContent(
-                        type="text",
-                        text=f"Staged changes:\n{diff}"
-                    )]
-
-                case GitTools.DIFF:
-                    repo = Repo(checkout)
-                    diff = git_diff(repo, arguments["target"])
-                    return [TextContent(
-                        type="text",
-                        text=f"Diff with {arguments['target']}:\n{diff}"
-                    )]
-
-                case GitTools.COMMIT:
-                    repo = Repo(checkout)
-                    result = git_commit(repo, arguments["message"])
-                    return [TextContent(
-                        type="text",
-                        text=result
-                    )]
-
-                case GitTools.RESET:
-                    repo = Repo(checkout)
-                    result = git_reset(repo)
-                    return [TextContent(
-                        type="text",
-                        text=result
-                    )]
-
-                case GitTools.LOG:
-                    repo = Repo(checkout)
-                    log = git_log(repo, arguments.get("max_count", 10))
-                    return [TextContent(
-                        type="text",
-                        text="Commit history:\n" + "\n".join(log)
-                    )]
-
-                case GitTools.SHOW:
-                    repo = Repo(checkout)
-                    result = git_show(repo, arguments["revision"])
-                    return [TextContent(
-                        type="text",
-                        text=result
-                    )]
-                case get_contents_handler.name:
-                    return await get_contents_handler.run_tool(arguments)
-                case create_file_handler.name:
-                    return await create_file_handler.run_tool(arguments)
-                case append_file_handler.name:
-                    return await append_file_handler.run_tool(arguments)
-                case delete_contents_handler.name:
-                    return await delete_contents_handler.run_tool(arguments)
-                case insert_file_handler.name:
-                    return await insert_file_handler.run_tool(arguments)
-                case patch_file_handler.name:
-                    return await patch_file_handler.run_tool(arguments)
-                case _:
-                    raise ValueError(f"Unknown tool: {name}")
+            if tool is not None:
+                # Opening a checkout for the first time writes its index (see
+                # git_enable_status_cache), so keep that off the event loop too.
+                repo = await asyncio.to_thread(
+                    _get_repo, _resolve_checkout(str(checkouts), arguments["checkout_path"])
+                )
+                return await _HANDLERS[tool](repo, arguments)
+            if name in text_handlers:
+                return await text_handlers[name].run_tool(arguments)
+            raise ValueError(f"Unknown tool: {name}")
         except ValueError:
             logger.error(traceback.format_exc())
             raise
@@ -225,10 +343,16 @@ async def main(repository: Path, checkouts: Path) -> None:
 
     """Main entry point for the MCP callaborator server."""
     logger.info(f"Starting MCP collaborator server v{__version__}")
+
+    # asyncio.to_thread runs git commands on the default executor; give them a
+    # dedicated pool sized to the CPU count rather than sharing asyncio's default.
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="git-")
+    )
     try:
         from mcp.server.stdio import stdio_server
 
-        async with stdio_server() as (read_stream, write_stream):
+        async with stdio_server(stdout=_stdout_writer()) as (read_stream, write_stream):
             await app.run(
                 read_stream,
                 write_stream,
@@ -2,14 +2,14 @@
 
 import os
 import tempfile
+from pathlib import Path
 from typing import AsyncGenerator, Generator
 
 import pytest
 import pytest_asyncio
+from git_helpers import init_repo
 from mcp.server import Server
 
-from mcp_collaborator.server import app
-
 
 @pytest.fixture
 def test_file() -> Generator[str, None, None]:
@@ -61,4 +61,10 @@ class MockStream:
 async def mock_server() -> AsyncGenerator[tuple[Server, MockStream], None]:
     """Create a mock server for testing."""
     mock_write_stream = MockStream()
-    yield app, mock_write_stream
+    yield Server("mcp-collaborator"), mock_write_stream
+
+
+@pytest.fixture
+def git_repo_path(tmp_path: Path) -> Path:
+    """Create an empty git repository with a test identity configured."""
+    return init_repo(tmp_path)
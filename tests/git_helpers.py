@@ -0,0 +1,31 @@
+"""Helpers for tests that work with real git repositories."""
+
+import subprocess
+from pathlib import Path
+
+
+def run_git(path: Path, *args: str, env: dict[str, str] | None = None) -> str:
+    """Run a git command in path and return its stripped stdout."""
+    return subprocess.run(
+        ["git", "-C", str(path), *args],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env,
+    ).stdout.strip()
+
+
+def init_repo(path: Path) -> Path:
+    """Initialize an empty repository with a test identity configured."""
+    run_git(path, "init", "-q")
+    run_git(path, "config", "user.name", "Test User")
+    run_git(path, "config", "user.email", "test@example.com")
+    return path
+
+
+def commit_file(path: Path, name: str, content: bytes, message: str) -> str:
+    """Write a file, commit it and return the new commit hash."""
+    (path / name).write_bytes(content)
+    run_git(path, "add", name)
+    run_git(path, "commit", "-q", "-m", message)
+    return run_git(path, "rev-parse", "HEAD")
@@ -0,0 +1,40 @@
+"""Tests for splitting large tool output into TextContent chunks."""
+
+from mcp_collaborator.server import _chunk_text
+
+
+def test_short_text_single_chunk():
+    """Test that text within the limit is returned as one item."""
+    result = _chunk_text("line 1\nline 2\n", size=100)
+    assert len(result) == 1
+    assert result[0].type == "text"
+    assert result[0].text == "line 1\nline 2\n"
+
+
+def test_empty_text():
+    """Test that empty text still produces one empty item."""
+    result = _chunk_text("", size=10)
+    assert [chunk.text for chunk in result] == [""]
+
+
+def test_splits_on_line_breaks():
+    """Test that chunks end at the last line break within the limit."""
+    text = "aaaa\nbbbb\ncccc\ndddd\n"
+    result = _chunk_text(text, size=12)
+    assert [chunk.text for chunk in result] == ["aaaa\nbbbb\n", "cccc\ndddd\n"]
+
+
+def test_hard_split_without_line_breaks():
+    """Test that a line longer than the limit is split at the limit."""
+    text = "x" * 25
+    result = _chunk_text(text, size=10)
+    assert [chunk.text for chunk in result] == ["x" * 10, "x" * 10, "x" * 5]
+
+
+def test_mixed_long_and_short_lines():
+    """Test that chunks never exceed the limit and rejoin to the input."""
+    text = "short\n" + "y" * 30 + "\nend\n"
+    result = _chunk_text(text, size=10)
+    assert all(len(chunk.text) <= 10 for chunk in result)
+    assert "".join(chunk.text for chunk in result) == text
+    assert result[0].text == "short\n"
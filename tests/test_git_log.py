@@ -0,0 +1,68 @@
+"""Tests for git_log output parsing."""
+
+import os
+from pathlib import Path
+
+import git
+import pytest
+from git_helpers import run_git
+
+from mcp_collaborator.git import git_log
+
+
+def expected_entry(commit: git.Commit) -> str:
+    """Format a commit the way git_log did when it used iter_commits."""
+    return (
+        f"Commit: {commit.hexsha}\n"
+        f"Author: {commit.author}\n"
+        f"Date: {commit.authored_datetime}\n"
+        f"Message: {commit.message}\n"
+    )
+
+
+@pytest.fixture
+def repo(git_repo_path: Path) -> git.Repo:
+    """Create a repository with single-line and multi-line commit messages."""
+    messages = [
+        "first",
+        "second\n\nA body paragraph.\n\nAnother paragraph\nwith two lines.",
+        "third: unicode é and trailing spaces   ",
+    ]
+    for i, message in enumerate(messages):
+        (git_repo_path / "file.txt").write_text(f"{i}\n")
+        run_git(git_repo_path, "add", "file.txt")
+        run_git(
+            git_repo_path,
+            "commit",
+            "-q",
+            "-m",
+            message,
+            env={**os.environ, "GIT_AUTHOR_DATE": f"2024-01-0{i + 1}T12:00:00+05:30"},
+        )
+    return git.Repo(git_repo_path)
+
+
+def test_log_matches_commit_objects(repo):
+    """Test every record against the commit's own fields."""
+    log = git_log(repo)
+    commits = list(repo.iter_commits())
+    assert len(log) == 3
+    assert log == [expected_entry(commit) for commit in commits]
+
+
+def test_log_multiline_message(repo):
+    """Test that blank lines inside a message don't split records."""
+    entry = git_log(repo)[1]
+    assert entry.endswith(
+        "Message: second\n\nA body paragraph.\n\nAnother paragraph\nwith two lines.\n\n"
+    )
+    assert "Date: 2024-01-02 12:00:00+05:30\n" in entry
+
+
+def test_log_max_count(repo):
+    """Test that max_count limits the number of records."""
+    log = git_log(repo, max_count=2)
+    assert len(log) == 2
+    assert "Message: third" in log[0]
+    assert "Message: second" in log[1]
+    assert git_log(repo, max_count=0) == []
@@ -0,0 +1,144 @@
+"""Tests for git_show and its persistent cat-file/diff-tree processes."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import git
+import pytest
+from git_helpers import commit_file, init_repo, run_git
+
+from mcp_collaborator import git as git_module
+from mcp_collaborator.git import _close_process, _git_process, git_show
+
+
+@pytest.fixture
+def repo_path(git_repo_path: Path) -> Path:
+    """Create a repository with a root commit and one follow-up commit."""
+    commit_file(git_repo_path, "a.txt", b"one\ntwo\n", "root commit")
+    commit_file(git_repo_path, "a.txt", b"one\nthree\n", "second commit")
+    return git_repo_path
+
+
+@pytest.fixture
+def repo(repo_path: Path) -> git.Repo:
+    """Open the test repository."""
+    return git.Repo(repo_path)
+
+
+def test_show_root_commit(repo, repo_path):
+    """Test that a root commit is diffed against the empty tree."""
+    root = run_git(repo_path, "rev-list", "--max-parents=0", "HEAD")
+    result = git_show(repo, root)
+    assert result.startswith(f"Commit: {root}\nAuthor: Test User\n")
+    assert "Message: root commit\n" in result
+    assert "new file mode 100644" in result
+    assert "+one\n+two\n" in result
+
+
+def test_show_normal_commit(repo, repo_path):
+    """Test that a commit is diffed against its first parent."""
+    head = run_git(repo_path, "rev-parse", "HEAD")
+    result = git_show(repo, "HEAD")
+    assert result.startswith(f"Commit: {head}\n")
+    assert "Message: second commit\n" in result
+    assert "diff --git a/a.txt b/a.txt" in result
+    assert "-two\n+three\n" in result
+    assert "new file mode" not in result
+
+
+def test_show_empty_diff(repo, repo_path):
+    """Test a commit without changes, followed by a commit with changes."""
+    run_git(repo_path, "commit", "-q", "--allow-empty", "-m", "empty commit")
+    empty = run_git(repo_path, "rev-parse", "HEAD")
+    result = git_show(repo, empty)
+    assert result.endswith("Message: empty commit\n\n\n")
+    assert "diff --git" not in result
+
+    # The process must still be in sync for the next request.
+    result = git_show(repo, "HEAD~1")
+    assert "Message: second commit\n" in result
+    assert "-two\n+three\n" in result
+
+
+def test_show_unknown_revision(repo):
+    """Test that an unknown revision raises and later calls still work."""
+    with pytest.raises(ValueError, match="Unknown revision: does-not-exist"):
+        git_show(repo, "does-not-exist")
+    with pytest.raises(ValueError, match="Invalid revision"):
+        git_show(repo, "HEAD\nHEAD")
+
+    result = git_show(repo, "HEAD")
+    assert "Message: second commit\n" in result
+    assert "-two\n+three\n" in result
+
+
+def test_show_non_utf8_patch(repo, repo_path):
+    """Test that invalid UTF-8 in a patch is replaced instead of raising."""
+    commit_file(repo_path, "latin1.txt", b"caf\xe9\n", "latin-1 content")
+    result = git_show(repo, "HEAD")
+    assert "+caf\ufffd\n" in result
+
+    result = git_show(repo, "HEAD~1")
+    assert "Message: second commit\n" in result
+
+
+def test_show_commit_made_after_process_started(repo, repo_path):
+    """Test that commits created after the processes started are visible."""
+    assert "Message: second commit\n" in git_show(repo, "HEAD")
+
+    new = commit_file(repo_path, "b.txt", b"new file\n", "third commit")
+    result = git_show(repo, "HEAD")
+    assert result.startswith(f"Commit: {new}\n")
+    assert "Message: third commit\n" in result
+    assert "+new file\n" in result
+
+
+def show_in_new_thread(*repos: git.Repo) -> list[dict]:
+    """Run git_show on each repository in one fresh thread.
+
+    Returns a snapshot of the thread's process table after each call.
+    """
+
+    def run() -> list[dict]:
+        snapshots = []
+        for repo in repos:
+            git_show(repo, "HEAD")
+            snapshots.append(dict(git_module._local.procs))
+        return snapshots
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(run).result()
+
+
+def test_processes_evicted_least_recently_used(repo, tmp_path_factory, monkeypatch):
+    """Test that each thread keeps a bounded number of processes."""
+    other_path = init_repo(tmp_path_factory.mktemp("other"))
+    commit_file(other_path, "b.txt", b"b\n", "other commit")
+    other = git.Repo(other_path)
+    monkeypatch.setattr(git_module, "_MAX_PROCS_PER_THREAD", 2)
+
+    first, second = show_in_new_thread(repo, other)
+    try:
+        assert {git_dir for git_dir, _ in first} == {repo.git_dir}
+        assert {git_dir for git_dir, _ in second} == {other.git_dir}
+        assert all(proc.returncode is not None for proc in first.values())
+        assert not git_module._all_procs.intersection(first.values())
+        assert all(proc.poll() is None for proc in second.values())
+    finally:
+        for proc in second.values():
+            _close_process(proc)
+
+
+def test_dead_process_replaced(repo):
+    """Test that an exited process is closed cleanly and restarted."""
+    proc = _git_process(repo, "cat-file", "--batch")
+    proc.kill()
+    proc.wait()
+    # Unflushed input makes closing stdin raise BrokenPipeError.
+    proc.stdin.write(b"HEAD\n")
+
+    assert "Message: second commit\n" in git_show(repo, "HEAD")
+    new = _git_process(repo, "cat-file", "--batch")
+    assert new is not proc
+    assert proc not in git_module._all_procs
+    _close_process(new)
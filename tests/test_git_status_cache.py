@@ -0,0 +1,54 @@
+"""Tests for the untracked cache enabled on repositories opened by the server."""
+
+import os
+from pathlib import Path
+
+import pytest
+from git_helpers import commit_file
+
+from mcp_collaborator.git import git_status
+from mcp_collaborator.server import _get_repo
+
+
+def read_directory_stats(trace: Path) -> dict[str, int]:
+    """Return the read_directory counters from a GIT_TRACE2_PERF log."""
+    stats = {}
+    for line in trace.read_text().splitlines():
+        key, sep, value = line.rpartition("| ")[2].lstrip(".").partition(":")
+        if sep and key in ("node-creation", "directory-invalidation", "opendir"):
+            stats[key] = int(value)
+    return stats
+
+
+@pytest.fixture
+def repo_path(git_repo_path: Path) -> Path:
+    """Create a repository with tracked and untracked files in nested directories."""
+    commit_file(git_repo_path, "tracked.txt", b"tracked\n", "initial")
+    (git_repo_path / "untracked" / "nested").mkdir(parents=True)
+    (git_repo_path / "untracked" / "nested" / "file.txt").write_text("new\n")
+    (git_repo_path / "loose.txt").write_text("new\n")
+    # git doesn't trust cached directory entries whose mtime isn't older than
+    # the index, so move everything out of the racy window.
+    for path in [git_repo_path, *git_repo_path.glob("**/*")]:
+        if ".git" not in path.relative_to(git_repo_path).parts:
+            os.utime(path, (0, 0))
+    return git_repo_path
+
+
+def test_second_status_uses_untracked_cache(repo_path, tmp_path_factory, monkeypatch):
+    """Test that status writes the cache back and the next status reuses it."""
+    repo = _get_repo(str(repo_path))
+    # Keep the trace outside the work tree so writing it doesn't invalidate the cache.
+    trace = tmp_path_factory.mktemp("trace") / "trace2.log"
+    monkeypatch.setenv("GIT_TRACE2_PERF", str(trace))
+
+    first = git_status(repo)
+    assert "untracked/" in first
+    assert "loose.txt" in first
+    trace.unlink()
+
+    assert git_status(repo) == first
+    stats = read_directory_stats(trace)
+    assert stats["node-creation"] == 0
+    assert stats["directory-invalidation"] == 0
+    assert stats["opendir"] == 0
@@ -0,0 +1,65 @@
+"""Tests for git_status_summary and the git_status_summary tool."""
+
+from pathlib import Path
+
+import git
+import pytest
+from git_helpers import run_git
+
+from mcp_collaborator.git import GitTools, git_status_summary
+from mcp_collaborator.server import _HANDLERS
+
+
+@pytest.fixture
+def repo_path(git_repo_path: Path) -> Path:
+    """Create a repository with two committed files."""
+    (git_repo_path / "a.txt").write_text("a\n")
+    (git_repo_path / "b.txt").write_text("b\n")
+    run_git(git_repo_path, "add", ".")
+    run_git(git_repo_path, "commit", "-q", "-m", "initial")
+    return git_repo_path
+
+
+def test_clean_repo(repo_path):
+    """Test a repository without changes."""
+    summary = git_status_summary(git.Repo(repo_path))
+    assert summary == "Staged files: 0\nUnstaged files: 0"
+
+
+def test_staged_files(repo_path):
+    """Test staged modifications and additions."""
+    (repo_path / "a.txt").write_text("changed\n")
+    (repo_path / "c.txt").write_text("c\n")
+    run_git(repo_path, "add", "a.txt", "c.txt")
+    summary = git_status_summary(git.Repo(repo_path))
+    assert summary == "Staged files: 2\nUnstaged files: 0"
+
+
+def test_unstaged_files(repo_path):
+    """Test unstaged modifications; untracked files are not counted."""
+    (repo_path / "a.txt").write_text("changed\n")
+    (repo_path / "b.txt").unlink()
+    (repo_path / "untracked.txt").write_text("new\n")
+    summary = git_status_summary(git.Repo(repo_path))
+    assert summary == "Staged files: 0\nUnstaged files: 2"
+
+
+def test_unborn_head(git_repo_path):
+    """Test a repository whose HEAD does not point to a commit yet."""
+    repo = git.Repo(git_repo_path)
+    assert git_status_summary(repo) == "Staged files: 0\nUnstaged files: 0"
+
+    (git_repo_path / "a.txt").write_text("a\n")
+    run_git(git_repo_path, "add", "a.txt")
+    (git_repo_path / "a.txt").write_text("changed\n")
+    assert git_status_summary(repo) == "Staged files: 1\nUnstaged files: 1"
+
+
+@pytest.mark.asyncio
+async def test_status_summary_tool(repo_path):
+    """Test the git_status_summary tool handler."""
+    (repo_path / "a.txt").write_text("changed\n")
+    result = await _HANDLERS[GitTools.STATUS_SUMMARY](git.Repo(repo_path), {})
+    assert len(result) == 1
+    assert result[0].type == "text"
+    assert result[0].text == "Staged files: 0\nUnstaged files: 1"
@@ -0,0 +1,116 @@
+"""Tests for resolving and creating checkouts under the checkouts root."""
+
+from pathlib import Path
+
+import pytest
+from git_helpers import commit_file, init_repo, run_git
+
+from mcp_collaborator.git import GitTools
+from mcp_collaborator.server import (
+    _HANDLERS,
+    _create_checkout,
+    _get_repo,
+    _resolve_checkout,
+)
+
+
+@pytest.fixture
+def root(tmp_path: Path) -> Path:
+    """Create an empty checkouts root."""
+    checkouts = tmp_path / "checkouts"
+    checkouts.mkdir()
+    return checkouts
+
+
+def test_nested_path(root):
+    """Test that a nested relative path resolves inside the root."""
+    assert _resolve_checkout(str(root), "a/b") == str(root.resolve() / "a" / "b")
+
+
+@pytest.mark.parametrize("checkout_path", ["../x", "a/../../x"])
+def test_parent_traversal(root, checkout_path):
+    """Test that paths escaping through '..' are rejected."""
+    with pytest.raises(ValueError, match="must stay inside the checkouts root"):
+        _resolve_checkout(str(root), checkout_path)
+
+
+def test_absolute_path(root, tmp_path):
+    """Test that an absolute path outside the root is rejected."""
+    with pytest.raises(ValueError, match="must stay inside the checkouts root"):
+        _resolve_checkout(str(root), "/abs")
+    with pytest.raises(ValueError, match="must stay inside the checkouts root"):
+        _resolve_checkout(str(root), str(tmp_path / "elsewhere"))
+
+
+@pytest.mark.parametrize("checkout_path", ["", "."])
+def test_root_itself(root, checkout_path):
+    """Test that the checkouts root itself is not a valid checkout."""
+    with pytest.raises(ValueError, match="must stay inside the checkouts root"):
+        _resolve_checkout(str(root), checkout_path)
+
+
+def test_symlink_escaping_root(root, tmp_path):
+    """Test that a symlink pointing outside the root is rejected."""
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (root / "link").symlink_to(outside, target_is_directory=True)
+    with pytest.raises(ValueError, match="must stay inside the checkouts root"):
+        _resolve_checkout(str(root), "link")
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> Path:
+    """Create a source repository with one commit."""
+    path = tmp_path / "source"
+    path.mkdir()
+    init_repo(path)
+    commit_file(path, "a.txt", b"a\n", "initial")
+    return path
+
+
+@pytest.mark.asyncio
+async def test_local_repository_worktree(root, source):
+    """Test that a local repository gets a worktree that all git tools work in."""
+    config = (source / ".git" / "config").read_bytes()
+    checkout = Path(_resolve_checkout(str(root), "feat/x"))
+
+    status = _create_checkout(source, checkout, "feat/x")
+    assert status == "Initialized new working checkout path: 'feat/x'"
+    assert (checkout / ".git").is_file()
+    assert run_git(checkout, "branch", "--show-current") == "feat/x"
+
+    repo = _get_repo(str(checkout))
+    (checkout / "a.txt").write_text("changed\n")
+    result = await _HANDLERS[GitTools.STATUS](repo, {})
+    assert "modified:   a.txt" in result[0].text
+
+    run_git(checkout, "add", "a.txt")
+    result = await _HANDLERS[GitTools.COMMIT](repo, {"message": "worktree commit"})
+    assert result[0].text.startswith("Changes committed successfully")
+
+    result = await _HANDLERS[GitTools.LOG](repo, {"max_count": 5})
+    assert "Message: worktree commit" in result[0].text
+    assert "Message: initial" in result[0].text
+
+    result = await _HANDLERS[GitTools.SHOW](repo, {"revision": "HEAD"})
+    text = "".join(item.text for item in result)
+    assert "Message: worktree commit\n" in text
+    assert "-a\n+changed\n" in text
+
+    # The commit lands on the worktree's branch, not the source checkout's.
+    assert run_git(source, "log", "-1", "--format=%s", "feat/x") == "worktree commit"
+    assert run_git(source, "log", "-1", "--format=%s") == "initial"
+    assert (source / ".git" / "config").read_bytes() == config
+
+
+def test_remote_repository_clone(root, source):
+    """Test that a repository URL is cloned and a new branch checked out."""
+    checkout = Path(_resolve_checkout(str(root), "feat/y"))
+
+    status = _create_checkout(source.as_uri(), checkout, "feat/y")
+    assert status == "Initialized new working checkout path: 'feat/y'"
+    assert (checkout / ".git").is_dir()
+    assert run_git(checkout, "branch", "--show-current") == "feat/y"
+    assert run_git(checkout, "log", "-1", "--format=%s") == "initial"
+    # A clone, not a worktree of the source repository.
+    assert len(run_git(source, "worktree", "list").splitlines()) == 1